@@ -6,44 +6,102 @@ Uses Docling as the primary tool for extraction, leveraging PyMuPDF for
 potential fallbacks or specific operations, and Tesseract for OCR on
 scanned documents if needed by Docling internally or configured.
 """
+import hashlib  # PATCH: Added for content-hash result caching (2026-08-29)
+import io
 import logging
+import mmap  # PATCH: Added for single-read PDF buffering (2026-08-29)
 import json
 import os
 import re  # PATCH: Added for regex in post-processing (2025-10-16)
+import stat  # PATCH: Added for single-stat input check (2026-08-29)
+import tempfile
+import threading  # PATCH: Added for converter cache locking (2026-08-29)
+import atexit  # PATCH: Added for background-writer shutdown (2026-08-29)
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor  # PATCH: Added for batch ingestion / background IO (2026-08-29)
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any
+from typing import ClassVar, Dict, Iterator, List, Optional, Union, Any
 from pydantic import BaseModel, Field
-from docling.datamodel.base_models import InputFormat
-from docling.datamodel.document import ConversionResult
-from docling.datamodel.pipeline_options import PdfPipelineOptions
-from docling.document_converter import DocumentConverter, FormatOption
-
-# --- CORRECTED IMPORTS FOR DOCLING 2.1.0 TYPES (Using names found via inspection) ---
-# Import the main document type and correct item types for 2.1.0
-from docling_core.types.doc import DoclingDocument, TextItem, TableItem # Use names found by inspection
-# --- END CORRECTED IMPORTS ---
-
-# --- ADDITIONAL IMPORTS FOR FORMAT OPTION ARGUMENTS (Required by 2.1.0) ---
-from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend # Backend class
-from docling.pipeline.standard_pdf_pipeline import StandardPdfPipeline # Pipeline class
-# --- END ADDITIONAL IMPORTS ---
-
-# PATCH: Import pdfplumber for footnote recovery (2025-10-16)
+
+# PATCH: Docling/pdfplumber imports are now lazy (2026-08-29). The docling
+# stack pulls in torch/onnxruntime/EasyOCR — seconds of import time and a
+# large RSS footprint — which callers that only need the Pydantic models
+# (e.g. an API route validating payloads) should not pay for. See
+# IngestionAgent._lazy_imports and _extract_footnotes_with_pdfplumber.
+
+# PATCH: Prefer orjson for JSON output; fall back to stdlib json (2026-08-29)
 try:
-    import pdfplumber
+    import orjson
 except ImportError:
-    pdfplumber = None
-    logging.warning("pdfplumber not installed. Footnote recovery disabled.")
+    orjson = None
 
 # Configure logging for this module
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# PATCH: Hoist OCR fixes and cell-cleanup regexes to module level (2026-08-29)
+# Known OCR misreads observed in sample filings. Applied as a single compiled
+# alternation (longest key first) so each text item is scanned exactly once,
+# instead of one full str.replace pass per fix.
+# NOTE: The old single-character entries "l"->"1" / "O"->"0" were dropped here:
+# rewriting every 'l'/'O' corrupted correct prose. Numeric-only cells are
+# handled separately in _postprocess_table_cell.
+_OCR_FIXES = {
+    "Kegistration": "Registration",
+    "Kegistraton": "Registration",
+    "Kegisrraton": "Registration",
+    "IVo": "No",
+    "t0": "to",
+    "comapny": "company",
+    "concemn": "concern",
+    "Zoumpad": "audited",
+    "tnanaianpeaiod": "financial period",
+}
+_OCR_FIXES_RE = re.compile(
+    "|".join(re.escape(k) for k in sorted(_OCR_FIXES, key=len, reverse=True))
+)
+# Characters that are not part of a numeric cell (digits, separators, sign,
+# parentheses, whitespace, percent).
+_CELL_GARBAGE_RE = re.compile(r"[^0-9,.\-()\s%]")
+# Digit-like tokens in which OCR commonly misreads '1' as 'l' and '0' as 'O'.
+# Scoped to numeric cells only, so prose is never rewritten; str.translate is
+# a single C-level pass over the matched token.
+_DIGITLIKE_RE = re.compile(r"\b[\dlO,.\-()%]*\d[\dlO,.\-()%]*\b")
+_LO_TO_DIGITS = str.maketrans("lO", "10")
+# Matches one Markdown table row per line. Compiled over bytes: scanning and
+# cell splitting then stay in C code, and cells are decoded exactly once each
+# (see _markdown_to_list_of_lists). Separator rows ('| --- |:---:| ... |')
+# are skipped by the second pattern, which requires EVERY cell to be
+# separator-shaped — a first cell like '- Current' or '-111' is real data.
+_TABLE_ROW_RE = re.compile(rb"^\|(.+)\|\s*$", re.M)
+_TABLE_SEP_RE = re.compile(rb"^\|(?:\s*:?-+:?\s*\|)+\s*$")
+
+def _dumps_line(record: Dict[str, Any]) -> bytes:
+    """Encode one NDJSON record (newline-terminated bytes)."""
+    if orjson is not None:
+        return orjson.dumps(record) + b"\n"
+    return json.dumps(record, ensure_ascii=False).encode('utf-8') + b"\n"
+
+def _write_json_atomic(output_path: Path, payload: Dict[str, Any]) -> None:
+    """Serialize payload to output_path via a sibling tempfile + os.replace.
+
+    Uses orjson's C encoder when available (several times faster than stdlib
+    json with indent=2, and it emits bytes directly); readers see either the
+    old file or the complete new one, never a partial write.
+    """
+    tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+    if orjson is not None:
+        tmp_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, output_path)
+
 # --- Pydantic Models for Structured Output ---
 class ExtractedTable(BaseModel):
     """Represents an extracted table."""
     index: int = Field(..., description="Index of the table in the document.")
     markdown: str = Field(..., description="The table content in Markdown format.")
+    data: List[List[str]] = Field(default_factory=list, description="The table content as rows of cells, as consumed by the Mapping Agent.")
     page_number: Optional[int] = Field(None, description="The page number where the table was found.")
 
 class ExtractedTextBlock(BaseModel):
@@ -69,106 +127,282 @@ class IngestionAgent:
     Uses Docling for the primary extraction logic.
     """
 
-    def __init__(self, output_dir: Optional[Path] = None):
+    # PATCH: Docling types cached at class level by _lazy_imports (2026-08-29)
+    _docling_loaded: ClassVar[bool] = False
+
+    # PATCH: One DocumentConverter per pipeline configuration per process
+    # (2026-08-29). Constructing a converter with do_ocr=True loads the
+    # EasyOCR + layout + table-structure models — tens of seconds and >1 GB —
+    # so per-request agent instantiation must not rebuild it.
+    _converter_cache: ClassVar[Dict[tuple, Any]] = {}
+    _converter_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def _lazy_imports(cls) -> None:
+        """Import the heavy Docling stack once and cache the types we need.
+
+        Keeps module import cheap (pydantic/stdlib only); the torch/OCR model
+        registry is only pulled in when an agent is actually constructed.
+        """
+        if cls._docling_loaded:
+            return
+        from docling.datamodel.base_models import InputFormat
+        from docling.datamodel.pipeline_options import PdfPipelineOptions
+        from docling.document_converter import DocumentConverter, FormatOption
+        # --- CORRECTED IMPORTS FOR DOCLING 2.1.0 TYPES (Using names found via inspection) ---
+        from docling_core.types.doc import DoclingDocument, TextItem, TableItem
+        # --- ADDITIONAL IMPORTS FOR FORMAT OPTION ARGUMENTS (Required by 2.1.0) ---
+        from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend # Backend class
+        from docling.pipeline.standard_pdf_pipeline import StandardPdfPipeline # Pipeline class
+        cls._InputFormat = InputFormat
+        cls._PdfPipelineOptions = PdfPipelineOptions
+        cls._DocumentConverter = DocumentConverter
+        cls._FormatOption = FormatOption
+        cls._DoclingDocument = DoclingDocument
+        cls._TextItem = TextItem
+        cls._TableItem = TableItem
+        cls._PyPdfiumDocumentBackend = PyPdfiumDocumentBackend
+        cls._StandardPdfPipeline = StandardPdfPipeline
+        # DocumentStream lets us hand Docling an in-memory buffer instead of a
+        # path; not present in every Docling release, so probe for it.
+        try:
+            from docling.datamodel.base_models import DocumentStream
+        except ImportError:
+            DocumentStream = None
+        cls._DocumentStream = DocumentStream
+        cls._docling_loaded = True
+
+    def __init__(self, output_dir: Optional[Path] = None, num_threads: Optional[int] = None,
+                 enable_ocr: bool = True):
         """
         Initializes the Ingestion Agent.
         Sets up the Docling DocumentConverter with appropriate options.
+        Args:
+            output_dir: Where ingested JSON output is written.
+            num_threads: Intra-op thread budget for Docling's AI models.
+                Defaults to the DOCLING_THREADS env var, else os.cpu_count().
+                Batch workers pass 1 to avoid oversubscription.
+            enable_ocr: Run EasyOCR on image content. Even when True, full-page
+                OCR is not forced: pages whose embedded text layer extracts
+                cleanly skip the OCR model, which is the dominant pipeline cost
+                (often 5-20x) on born-digital filings. Pass False when the
+                corpus is known to be born-digital to skip OCR entirely.
         """
-        # PATCH: ADD THIS IMPORT AT TOP (with other imports) ---
+        self._lazy_imports()
         from docling.datamodel.pipeline_options import EasyOcrOptions
 
         # --- INSIDE __init__ METHOD ---
         logger.info("Initializing Ingestion Agent...")
 
         # PATCH: Correct OCR config for Docling 2.1.0 (2025-10-16)
-        pipeline_options = PdfPipelineOptions()
-        pipeline_options.do_ocr = True
-        pipeline_options.ocr_options = EasyOcrOptions(lang=["en"])  # Fixed: lang=["en"], not language=["eng"]
+        pipeline_options = self._PdfPipelineOptions()
+        pipeline_options.do_ocr = enable_ocr
+        # PATCH: Remember whether OCR ran so post-processing can be skipped on
+        # clean embedded text (2026-08-29). The OCR fixes exist purely to patch
+        # recognition errors; applying them to digital-origin text is wasted
+        # work and risks rewriting correct content.
+        self._ocr_enabled = pipeline_options.do_ocr
+        if enable_ocr:
+            # PATCH: Never force full-page OCR (2026-08-29): restrict the OCR
+            # model to image-only regions where pypdfium returned no text.
+            try:
+                pipeline_options.ocr_options = EasyOcrOptions(lang=["en"], force_full_page_ocr=False)  # Fixed: lang=["en"], not language=["eng"]
+            except TypeError:
+                # Older Docling without the force_full_page_ocr knob.
+                pipeline_options.ocr_options = EasyOcrOptions(lang=["en"])
+
+        # PATCH: Explicit accelerator thread budget (2026-08-29). Without this
+        # the layout/table-structure models inherit whatever OpenMP/torch
+        # default happens to be set — often 1 thread, sometimes oversubscribed.
+        try:
+            try:
+                from docling.datamodel.accelerator_options import AcceleratorDevice, AcceleratorOptions
+            except ImportError:
+                from docling.datamodel.pipeline_options import AcceleratorDevice, AcceleratorOptions
+            if num_threads is None:
+                num_threads = int(os.getenv("DOCLING_THREADS", os.cpu_count() or 4))
+            pipeline_options.accelerator_options = AcceleratorOptions(
+                num_threads=num_threads, device=AcceleratorDevice.CPU
+            )
+            logger.info(f"Accelerator configured with num_threads={num_threads} (CPU).")
+        except ImportError:
+            logger.warning("AcceleratorOptions not available in this Docling version; "
+                           "using library default thread settings.")
 
         format_options = {
-            InputFormat.PDF: FormatOption(
+            self._InputFormat.PDF: self._FormatOption(
                 generate_markdown=True,
-                backend=PyPdfiumDocumentBackend,
-                pipeline_cls=StandardPdfPipeline,
+                backend=self._PyPdfiumDocumentBackend,
+                pipeline_cls=self._StandardPdfPipeline,
                 pipeline_options=pipeline_options
             )
         }
 
-        self.converter = DocumentConverter(
-            format_options=format_options
+        # Reuse an existing converter for this exact configuration if one has
+        # already been built in this process (model loads dominate __init__).
+        converter_key = (
+            pipeline_options.do_ocr,
+            tuple(getattr(pipeline_options.ocr_options, 'lang', ()) or ()),
+            num_threads,
         )
+        with type(self)._converter_lock:
+            converter = type(self)._converter_cache.get(converter_key)
+            if converter is None:
+                converter = self._DocumentConverter(format_options=format_options)
+                type(self)._converter_cache[converter_key] = converter
+            else:
+                logger.info("Reusing cached DocumentConverter for this configuration.")
+        self.converter = converter
         logger.info("Ingestion Agent initialized.")
-        self.output_dir = output_dir or Path(__file__).resolve().parent.parent.parent / "ingested_data"
-        os.makedirs(self.output_dir, exist_ok=True)
+        self.output_dir = Path(output_dir) if output_dir else Path(__file__).resolve().parent.parent.parent / "ingested_data"
+        # Created once here; per-call code assumes it exists from now on.
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        # PATCH: Background writer for the ingested JSON (2026-08-29). Callers
+        # get their IngestionResult immediately; the serialization + disk write
+        # overlaps the next document's compute. Single worker keeps writes
+        # ordered; close() (registered atexit) drains it before exit.
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ingest-io")
+        atexit.register(self.close)
+
+        # PATCH: Fingerprint of the pipeline configuration for result caching (2026-08-29).
+        # A cached result is only valid for the exact options it was produced with.
+        self._cfg_fp = hashlib.blake2b(
+            repr((pipeline_options.do_ocr, getattr(pipeline_options.ocr_options, 'lang', None))).encode()
+        ).hexdigest()[:12]
+
+    def _cache_path_for(self, pdf_path: Path, pdf_hash: str) -> Path:
+        """Return the on-disk cache location for a given PDF content hash.
+
+        Deliberately not *.json: the Mapping Agent globs output_dir for
+        '*.json', and cache files must not be picked up as ingested output.
+        """
+        return self.output_dir / f"{pdf_path.stem}.{pdf_hash}.{self._cfg_fp}.cache"
+
+    def _load_cached_result(self, cache_path: Path) -> Optional[IngestionResult]:
+        """Load a previously computed IngestionResult, or None if absent/corrupt."""
+        if not cache_path.exists():
+            return None
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cached = IngestionResult.model_validate(json.load(f))
+            logger.info(f"Ingestion cache hit: {cache_path.name} (skipping conversion)")
+            return cached
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable ingestion cache {cache_path}: {e}")
+            return None
+
+    def _store_cached_result(self, cache_path: Path, result: IngestionResult) -> None:
+        """Atomically persist an IngestionResult for future cache hits."""
+        try:
+            fd, tmp_name = tempfile.mkstemp(dir=str(self.output_dir), suffix=".tmp")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(result.model_dump_json())
+            os.replace(tmp_name, cache_path)
+            logger.debug(f"Ingestion result cached to {cache_path}")
+        except Exception as e:
+            logger.warning(f"Failed to write ingestion cache {cache_path}: {e}")
+
+    # PATCH: OCR provenance check for gating post-processing (2026-08-29)
+    @staticmethod
+    def _item_used_ocr(item: Any) -> bool:
+        """Best-effort check of whether a Docling item's text came from OCR.
+
+        Docling 2.1.0 does not expose a uniform per-item OCR flag, and
+        'orig' matching 'text' is NOT evidence of an embedded text layer —
+        Docling's sanitization is frequently a no-op on exactly the short
+        corrupted strings the fixes target ('Kegistration No'). Without
+        positive per-item provenance, assume OCR so the corrections are
+        never skipped on text that might need them; skipping clean
+        born-digital corpora is what the enable_ocr=False gate is for.
+        Kept as a hook for Docling versions that expose real provenance.
+        """
+        return True
 
     # PATCH: Add post-processing helpers (2025-10-16)
     def _postprocess_text(self, text: str) -> str:
-        """Apply OCR and formatting corrections."""
+        """Apply OCR and formatting corrections in a single linear scan."""
         if not text:
             return text
-        fixes = {
-            "Kegistration": "Registration",
-            "Kegistraton": "Registration",
-            "Kegisrraton": "Registration",
-            "IVo": "No",
-            "t0": "to",
-            "comapny": "company",
-            "concemn": "concern",
-            "Zoumpad": "audited",
-            "tnanaianpeaiod": "financial period",
-            "l": "1",  # Use cautiously; may affect "l" in words
-            "O": "0",  # Use cautiously
-        }
-        for wrong, right in fixes.items():
-            text = text.replace(wrong, right)
-        return text
+        return _OCR_FIXES_RE.sub(lambda m: _OCR_FIXES[m.group(0)], text)
 
     def _postprocess_table_cell(self, cell: str) -> str:
         """Fix numeric formatting in table cells."""
         if not cell.strip():
             return cell
+        # PATCH: Repair 'l'/'O' misreads inside digit-like tokens only (2026-08-29).
+        # Must run before the garbage scrub, which would otherwise delete them.
+        cell = _DIGITLIKE_RE.sub(lambda m: m.group(0).translate(_LO_TO_DIGITS), cell)
         # Fix unbalanced parentheses
         if cell.count("(") > cell.count(")"):
             cell = cell.rstrip("_~ ") + ")"
         elif cell.count(")") > cell.count("("):
             cell = "(" + cell.lstrip("_~ ")
-        # Remove trailing garbage
-        cell = re.sub(r"[^0-9,\.\-\(\)\s%]", "", cell)
+        # Remove trailing garbage (precompiled at module level)
+        cell = _CELL_GARBAGE_RE.sub("", cell)
         return cell.strip()
 
-    def _extract_footnotes_with_pdfplumber(self, pdf_path: Path) -> List[str]:
-        """Recover footnotes missed by Docling (e.g., '*Deemed interest...')."""
-        if not pdfplumber:
+    def _extract_footnotes_with_pdfplumber(self, pdf_bytes: bytes) -> List[str]:
+        """Recover footnotes missed by Docling (e.g., '*Deemed interest...').
+
+        Works from the already-read PDF bytes (no second disk read) and only
+        runs the expensive tolerance-tuned crop extraction on pages whose
+        cheap full-page text actually contains a footnote marker.
+        """
+        # PATCH: Lazy import so non-ingesting processes never load pdfplumber (2026-08-29)
+        try:
+            import pdfplumber
+        except ImportError:
+            logger.warning("pdfplumber not installed. Footnote recovery disabled.")
             return []
         footnotes = []
         try:
-            with pdfplumber.open(pdf_path) as pdf:
+            with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
                 for page in pdf.pages:
+                    # Cheap prefilter: skip pages without any footnote marker.
+                    page_text = page.extract_text()
+                    if not page_text or (
+                        "*Deemed interest" not in page_text
+                        and "pursuant to Section 59" not in page_text
+                    ):
+                        page.flush_cache()
+                        continue
                     # Extract bottom 10% of page where footnotes often reside
                     crop = page.crop((0, page.height * 0.9, page.width, page.height))
                     text = crop.extract_text(x_tolerance=1, y_tolerance=1)
                     if text and ("*Deemed interest" in text or "pursuant to Section 59" in text):
                         footnotes.append(f"<p>{text.strip()}</p>")
+                    # Keep RSS bounded on long documents.
+                    page.flush_cache()
         except Exception as e:
             logger.warning(f"Footnote extraction failed: {e}")
         return footnotes
 
-    def _markdown_to_list_of_lists(self, markdown_str: str) -> List[List[str]]:
+    def _markdown_to_list_of_lists(self, markdown_str: str, clean_cells: bool = True) -> List[List[str]]:
         """
         Converts a Markdown table string into a list of lists of strings.
         This is the format expected by the Mapping Agent.
+        Args:
+            markdown_str: The Markdown table content.
+            clean_cells: Apply the OCR numeric-cell scrub. Pass False for
+                tables from a clean embedded text layer, which need no repair.
         """
         if not markdown_str:
             return []
-        lines = markdown_str.strip().split('\n')
-        data_lines = [line for line in lines if line.startswith('|') and not (line.startswith('| ---') or line.startswith('|:---') or line.startswith('| ---:'))]
-        list_of_lists = []
-        for line in data_lines:
-            row = [cell.strip() for cell in line.strip('|').split('|')]
-            # PATCH: Apply cell-level post-processing (2025-10-16)
-            row = [self._postprocess_table_cell(cell) for cell in row]
-            list_of_lists.append(row)
-        return list_of_lists
+        # Single regex pass over the whole table, encoded once to bytes so row
+        # matching and b'|' cell splitting run fully in C; each cell is decoded
+        # exactly once. Rows where every cell is separator-shaped are skipped.
+        data = markdown_str.encode('utf-8')
+        rows = (m for m in _TABLE_ROW_RE.finditer(data) if not _TABLE_SEP_RE.match(m.group(0)))
+        if clean_cells:
+            return [
+                [self._postprocess_table_cell(cell.strip().decode('utf-8')) for cell in m.group(1).split(b'|')]
+                for m in rows
+            ]
+        return [
+            [cell.strip().decode('utf-8') for cell in m.group(1).split(b'|')]
+            for m in rows
+        ]
 
     def process(self, pdf_path: Union[str, Path], save_to_json: bool = True) -> IngestionResult:
         """
@@ -181,65 +415,100 @@ class IngestionAgent:
         """
         pdf_path = Path(pdf_path)
         logger.info(f"Starting ingestion process for: {pdf_path}")
-        if not pdf_path.exists() or not pdf_path.is_file():
+        # PATCH: One stat call instead of exists() + is_file() (2026-08-29)
+        try:
+            if not stat.S_ISREG(pdf_path.stat().st_mode):
+                raise OSError("not a regular file")
+        except OSError:
             error_msg = f"PDF file not found or is not a file: {pdf_path}"
             logger.error(error_msg)
             return IngestionResult(success=False, message=error_msg, source_path=str(pdf_path))
+
+        # PATCH: Content-addressed result cache (2026-08-29). Re-ingesting an
+        # unchanged PDF with unchanged pipeline options skips the full Docling
+        # pipeline (OCR + layout + table structure) entirely.
+        # PATCH: Read the PDF once via mmap (2026-08-29). The same buffer backs
+        # the cache-key hash, the Docling conversion, and pdfplumber footnote
+        # recovery, so the file leaves the page cache a single time.
+        with open(pdf_path, 'rb') as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    pdf_hash = hashlib.blake2b(mm).hexdigest()[:16]
+                    pdf_bytes = bytes(mm)
+            except ValueError:  # zero-length file cannot be mapped
+                pdf_bytes = f.read()
+                pdf_hash = hashlib.blake2b(pdf_bytes).hexdigest()[:16]
+        cache_path = self._cache_path_for(pdf_path, pdf_hash)
+        cached_result = self._load_cached_result(cache_path)
+        if cached_result is not None:
+            if save_to_json:
+                output_path = self.output_dir / f"{pdf_path.stem}_ingested.json"
+                # The cache may predate any JSON-producing run (or the file was
+                # deleted since); the cached result carries the parsed table
+                # data, so the mapping payload can be rebuilt without
+                # re-converting.
+                if not output_path.exists():
+                    self._io_pool.submit(
+                        self._save_json_in_background, output_path,
+                        self._mapping_payload(pdf_path.name, cached_result.tables,
+                                              cached_result.text_blocks))
+            return cached_result
+
         try:
             logger.info("Converting document using Docling...")
-            result: ConversionResult = self.converter.convert(str(pdf_path))
-            docling_doc: DoclingDocument = result.document
+            # Feed Docling from the in-memory buffer when the API allows it;
+            # older releases without DocumentStream fall back to the path.
+            if self._DocumentStream is not None:
+                source = self._DocumentStream(name=pdf_path.name, stream=io.BytesIO(pdf_bytes))
+            else:
+                source = str(pdf_path)
+            result = self.converter.convert(source)  # ConversionResult
+            docling_doc = result.document  # DoclingDocument
             if not docling_doc:
                  error_msg = f"Docling failed to create a document object for: {pdf_path}. Error: {result.errors}"
                  logger.error(error_msg)
                  return IngestionResult(success=False, message=error_msg, source_path=str(pdf_path))
 
             logger.info("Extracting tables and text blocks...")
-            tables: List[ExtractedTable] = []
-            text_blocks: List[ExtractedTextBlock] = []
-            table_counter = 0
-            text_counter = 0
+            # PATCH: Bulk extraction via comprehensions + model_construct (2026-08-29).
+            # model_construct skips Pydantic validation, which is safe here since
+            # every field is built locally; on documents with thousands of items
+            # this removes the dominant per-item overhead of the old loops.
 
             # --- Extract Tables ---
-            logger.info(f"Found {len(docling_doc.tables) if hasattr(docling_doc, 'tables') else 0} table objects in docling_doc.tables")
-            for table_obj in docling_doc.tables:
-                if isinstance(table_obj, TableItem):
-                    try:
-                        markdown_content = table_obj.export_to_markdown(doc=docling_doc)
-                        # PATCH: Apply text-level post-processing to markdown (2025-10-16)
-                        markdown_content = self._postprocess_text(markdown_content)
-                    except AttributeError:
-                        logger.warning(f"Table object ({type(table_obj)}) does not have 'export_to_markdown' method. Skipping.")
-                        continue
-                    page_num = None
-                    tables.append(ExtractedTable(index=table_counter, markdown=markdown_content, page_number=page_num))
-                    table_counter += 1
-                    logger.debug(f"Extracted table {table_counter} (Page {page_num}).")
-                else:
-                    logger.debug(f"Object in docling_doc.tables is not a TableItem: {type(table_obj)}")
+            raw_table_items = [t for t in getattr(docling_doc, 'tables', []) if isinstance(t, self._TableItem)]
+            logger.info(f"Found {len(raw_table_items)} table objects in docling_doc.tables")
+            # PATCH: Post-process the markdown and parse list-of-lists once per
+            # table; only OCR-derived tables get the error-correction scrub.
+            tables: List[ExtractedTable] = []
+            for i, t in enumerate(raw_table_items):
+                md = t.export_to_markdown(doc=docling_doc)
+                is_ocr = self._ocr_enabled and self._item_used_ocr(t)
+                if is_ocr:
+                    md = self._postprocess_text(md)
+                tables.append(ExtractedTable.model_construct(
+                    index=i,
+                    markdown=md,
+                    data=self._markdown_to_list_of_lists(md, clean_cells=is_ocr),
+                    page_number=None,
+                ))
 
             # --- Extract Text Blocks ---
-            logger.info(f"Found {len(docling_doc.texts) if hasattr(docling_doc, 'texts') else 0} text objects in docling_doc.texts")
-            for text_obj in docling_doc.texts:
-                if isinstance(text_obj, TextItem):
-                    try:
-                        plain_text = text_obj.text
-                        # PATCH: Apply text-level post-processing (2025-10-16)
-                        plain_text = self._postprocess_text(plain_text)
-                    except AttributeError:
-                        logger.warning(f"Text object ({type(text_obj)}) does not have 'text' attribute. Skipping.")
-                        continue
-                    html_content = f"<p>{plain_text}</p>"
-                    page_num = None
-                    text_type = "paragraph"
-                    text_blocks.append(ExtractedTextBlock(index=text_counter, html=html_content, page_number=page_num, text_type=text_type))
-                    text_counter += 1
-                    logger.debug(f"Extracted text block {text_counter} (Page {page_num}).")
-                else:
-                    logger.debug(f"Object in docling_doc.texts is not a TextItem: {type(text_obj)}")
+            raw_text_items = [t for t in getattr(docling_doc, 'texts', []) if isinstance(t, self._TextItem)]
+            logger.info(f"Found {len(raw_text_items)} text objects in docling_doc.texts")
+            # Skip the OCR-fix scan entirely for clean embedded text items.
+            text_blocks: List[ExtractedTextBlock] = [
+                ExtractedTextBlock.model_construct(
+                    index=i,
+                    html="<p>" + (self._postprocess_text(t.text) if self._ocr_enabled and self._item_used_ocr(t) else t.text) + "</p>",
+                    page_number=None,
+                    text_type="paragraph",
+                )
+                for i, t in enumerate(raw_text_items)
+            ]
 
             # PATCH: Recover footnotes using pdfplumber (2025-10-16)
-            extra_footnotes = self._extract_footnotes_with_pdfplumber(pdf_path)
+            extra_footnotes = self._extract_footnotes_with_pdfplumber(pdf_bytes)
             for footnote_html in extra_footnotes:
                 text_blocks.append(ExtractedTextBlock(
                     index=len(text_blocks),
@@ -254,35 +523,14 @@ class IngestionAgent:
             logger.info(f"Ingestion successful. Extracted {len(tables)} tables and {len(text_blocks)} text blocks.")
 
             if save_to_json:
-                raw_tables_for_mapping = []
-                for i, pydantic_table in enumerate(tables):
-                    table_data_as_lists = self._markdown_to_list_of_lists(pydantic_table.markdown)
-                    raw_table = {
-                        "name": f"Table_{pydantic_table.index}",
-                        "data": table_data_as_lists,
-                        "header_row_index": 0
-                    }
-                    raw_tables_for_mapping.append(raw_table)
-
-                raw_text_blocks_for_mapping = [
-                    {"text": tb.html, "page_number": tb.page_number} for tb in text_blocks
-                ]
-                output_data_for_mapping = {
-                    "source_pdf": pdf_path.name,
-                    "tables": raw_tables_for_mapping,
-                    "text_blocks": raw_text_blocks_for_mapping
-                }
-
+                output_data_for_mapping = self._mapping_payload(pdf_path.name, tables, text_blocks)
                 output_filename = f"{pdf_path.stem}_ingested.json"
                 output_path = self.output_dir / output_filename
-                try:
-                    with open(output_path, 'w', encoding='utf-8') as f:
-                        json.dump(output_data_for_mapping, f, indent=2, ensure_ascii=False)
-                    logger.info(f"Ingested data saved to {output_path}")
-                except Exception as e:
-                    logger.error(f"Failed to save ingestion output to {output_path}: {e}")
-
-            return IngestionResult(
+                # Safe to hand off: output_data_for_mapping is not mutated
+                # after submission.
+                self._io_pool.submit(self._save_json_in_background, output_path, output_data_for_mapping)
+
+            final_result = IngestionResult(
                 success=True,
                 message="PDF ingestion completed successfully.",
                 tables=tables,
@@ -290,11 +538,182 @@ class IngestionAgent:
                 source_path=str(pdf_path),
                 num_pages=num_pages
             )
+            self._store_cached_result(cache_path, final_result)
+            return final_result
         except Exception as e:
             error_msg = f"An error occurred during ingestion: {str(e)}"
             logger.error(error_msg, exc_info=True)
             return IngestionResult(success=False, message=error_msg, source_path=str(pdf_path))
 
+    def process_iter(
+        self,
+        pdf_path: Union[str, Path],
+        ndjson_path: Optional[Path] = None,
+    ) -> Iterator[Union[ExtractedTable, ExtractedTextBlock]]:
+        """
+        Streaming variant of process(): yields each extracted table and text
+        block as soon as it is built, instead of accumulating full lists plus
+        a second copy for the JSON payload. Peak memory stays O(1) per item
+        after conversion, which matters on very large filings.
+        Args:
+            pdf_path: Path to the PDF file to process.
+            ndjson_path: If given, items are also written incrementally as
+                newline-delimited JSON — first line is a
+                {"source_pdf": ..., "kind": "header"} record, then one
+                {"kind": "table"|"text_block", ...} record per item.
+        Yields:
+            ExtractedTable and ExtractedTextBlock items in document order.
+        Raises:
+            RuntimeError: If Docling fails to produce a document.
+        """
+        pdf_path = Path(pdf_path)
+        logger.info(f"Starting streaming ingestion for: {pdf_path}")
+        pdf_bytes = pdf_path.read_bytes()
+        if self._DocumentStream is not None:
+            source = self._DocumentStream(name=pdf_path.name, stream=io.BytesIO(pdf_bytes))
+        else:
+            source = str(pdf_path)
+        result = self.converter.convert(source)
+        docling_doc = result.document
+        if not docling_doc:
+            raise RuntimeError(f"Docling failed to create a document object for: {pdf_path}. Error: {result.errors}")
+
+        writer = open(ndjson_path, 'wb') if ndjson_path else None
+        try:
+            if writer:
+                writer.write(_dumps_line({"kind": "header", "source_pdf": pdf_path.name}))
+
+            table_idx = 0
+            for t in getattr(docling_doc, 'tables', []):
+                if not isinstance(t, self._TableItem):
+                    continue
+                md = t.export_to_markdown(doc=docling_doc)
+                is_ocr = self._ocr_enabled and self._item_used_ocr(t)
+                if is_ocr:
+                    md = self._postprocess_text(md)
+                table = ExtractedTable.model_construct(
+                    index=table_idx, markdown=md,
+                    data=self._markdown_to_list_of_lists(md, clean_cells=is_ocr),
+                    page_number=None,
+                )
+                table_idx += 1
+                if writer:
+                    writer.write(_dumps_line({"kind": "table", **table.model_dump()}))
+                yield table
+
+            text_idx = 0
+            for t in getattr(docling_doc, 'texts', []):
+                if not isinstance(t, self._TextItem):
+                    continue
+                plain_text = t.text
+                if self._ocr_enabled and self._item_used_ocr(t):
+                    plain_text = self._postprocess_text(plain_text)
+                block = ExtractedTextBlock.model_construct(
+                    index=text_idx, html="<p>" + plain_text + "</p>",
+                    page_number=None, text_type="paragraph",
+                )
+                text_idx += 1
+                if writer:
+                    writer.write(_dumps_line({"kind": "text_block", **block.model_dump()}))
+                yield block
+
+            for footnote_html in self._extract_footnotes_with_pdfplumber(pdf_bytes):
+                block = ExtractedTextBlock.model_construct(
+                    index=text_idx, html=footnote_html,
+                    page_number=None, text_type="footnote",
+                )
+                text_idx += 1
+                if writer:
+                    writer.write(_dumps_line({"kind": "text_block", **block.model_dump()}))
+                yield block
+        finally:
+            if writer:
+                writer.close()
+
+    @staticmethod
+    def _mapping_payload(pdf_name: str, tables: List[ExtractedTable],
+                         text_blocks: List[ExtractedTextBlock]) -> Dict[str, Any]:
+        """Builds the *_ingested.json structure the Mapping Agent consumes."""
+        return {
+            "source_pdf": pdf_name,
+            "tables": [
+                {
+                    "name": f"Table_{pydantic_table.index}",
+                    "data": pydantic_table.data,  # Parsed once in the extraction loop
+                    "header_row_index": 0
+                }
+                for pydantic_table in tables
+            ],
+            "text_blocks": [
+                {"text": tb.html, "page_number": tb.page_number} for tb in text_blocks
+            ],
+        }
+
+    @staticmethod
+    def _save_json_in_background(output_path: Path, payload: Dict[str, Any]) -> None:
+        """Write one ingested-JSON payload; runs on the agent's IO thread."""
+        try:
+            _write_json_atomic(output_path, payload)
+            logger.info(f"Ingested data saved to {output_path}")
+        except Exception as e:
+            logger.error(f"Failed to save ingestion output to {output_path}: {e}")
+
+    def close(self) -> None:
+        """Drain pending background writes. Safe to call more than once."""
+        pool = getattr(self, "_io_pool", None)
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def process_batch(
+        self,
+        pdf_paths: List[Union[str, Path]],
+        max_workers: Optional[int] = None,
+        save_to_json: bool = True,
+    ) -> Iterator[IngestionResult]:
+        """
+        Processes multiple PDFs in parallel across worker processes.
+        Each worker builds its own DocumentConverter once (models load once per
+        worker, not per document) and is pinned to a single intra-op thread so
+        workers do not oversubscribe the CPU. Results are yielded in input order.
+        Args:
+            pdf_paths: Paths of the PDF files to process.
+            max_workers: Number of worker processes (defaults to os.cpu_count()).
+            save_to_json: If True, each worker saves its output JSON as in process().
+        Yields:
+            An IngestionResult per input path, in order.
+        """
+        paths = [str(p) for p in pdf_paths]
+        logger.info(f"Starting batch ingestion of {len(paths)} PDFs "
+                    f"(max_workers={max_workers or os.cpu_count()})...")
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_batch_worker_init,
+            initargs=(str(self.output_dir), save_to_json, self._ocr_enabled),
+        ) as executor:
+            # chunksize=1 so a single slow document does not stall a whole chunk.
+            yield from executor.map(_batch_worker_process, paths, chunksize=1)
+
+# --- Batch worker plumbing (module-level so it is picklable) ---
+# One IngestionAgent per worker process, built lazily by the pool initializer.
+_BATCH_WORKER_AGENT: Optional["IngestionAgent"] = None
+_BATCH_WORKER_SAVE_JSON: bool = True
+
+def _batch_worker_init(output_dir: str, save_to_json: bool, enable_ocr: bool = True) -> None:
+    """Pool initializer: build one agent per worker with a 1-thread budget,
+    mirroring the parent agent's OCR setting so results and cache keys match."""
+    global _BATCH_WORKER_AGENT, _BATCH_WORKER_SAVE_JSON
+    # Pin intra-op threads before any model library initializes, so N workers
+    # do not each spawn N OpenMP threads.
+    os.environ.setdefault("OMP_NUM_THREADS", "1")
+    _BATCH_WORKER_AGENT = IngestionAgent(output_dir=Path(output_dir), num_threads=1,
+                                         enable_ocr=enable_ocr)
+    _BATCH_WORKER_SAVE_JSON = save_to_json
+
+def _batch_worker_process(pdf_path: str) -> IngestionResult:
+    """Pool task: run one PDF through the worker's agent."""
+    assert _BATCH_WORKER_AGENT is not None, "worker initializer did not run"
+    return _BATCH_WORKER_AGENT.process(pdf_path, save_to_json=_BATCH_WORKER_SAVE_JSON)
+
 # --- Main Execution Block (for testing the agent directly) ---
 if __name__ == "__main__":
     import sys
@@ -3,13 +3,58 @@
 import json
 import logging
 import os
+import pickle  # PATCH: Added for the parsed-taxonomy cache (2026-08-29)
 import re
+from concurrent.futures import ProcessPoolExecutor  # PATCH: Batch mapping fan-out (2026-08-29)
 from pathlib import Path
 import xml.etree.ElementTree as ET
-import pandas as pd
-from thefuzz import fuzz # Requires: pip install thefuzz
 from typing import List, Dict, Any, Optional, Tuple
 
+# PATCH: pandas is now only a fallback reader for the reference workbook
+# (2026-08-29); the primary path streams cells with read-only openpyxl.
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+# PATCH: Prefer rapidfuzz over thefuzz (2026-08-29). Same scoring API, but the
+# C++ implementation with batch helpers (process.extractOne) removes the
+# per-pair Python call overhead that dominated the fuzzy-matching hot loop.
+try:
+    from rapidfuzz import fuzz
+    from rapidfuzz import process as rf_process
+except ImportError:
+    from thefuzz import fuzz # Requires: pip install thefuzz
+    rf_process = None
+    logging.warning("rapidfuzz not installed; falling back to thefuzz (slower).")
+
+# PATCH: numpy backs the batched cdist score matrix (2026-08-29)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# PATCH: Prefer lxml's C parser for streaming the label linkbase (2026-08-29)
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
+# PATCH: Columnar Parquet output for mapped facts (2026-08-29)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+# PATCH: Sparse TF-IDF matcher for large taxonomies (2026-08-29). Char-trigram
+# vectors + one sparse matrix multiply replace the O(rows x concepts)
+# edit-distance grid when the taxonomy is big enough to make that grid hurt.
+try:
+    from sklearn.feature_extraction.text import TfidfVectorizer
+except ImportError:
+    TfidfVectorizer = None
+
 # --- Configuration ---
 # Define base directories
 PROJECT_ROOT = Path(__file__).parent
@@ -22,6 +67,29 @@ REFERENCE_XLSX_PATH = PROJECT_ROOT / "backend" / "reference" / "FS-MFRS-2022-12-
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# PATCH: Shared normalization for fuzzy label matching (2026-08-29). Both
+# taxonomy labels (once, at load) and extracted queries (once, per lookup) go
+# through the same pipeline, so the scorer compares short token sets instead
+# of raw strings with punctuation and filler words.
+_PUNCT_RE = re.compile(r"[^a-z0-9 ]+")
+_STOPWORDS = frozenset({
+    "the", "of", "and", "in", "to", "for", "on", "a", "an", "at", "by",
+    "from", "or",
+})
+
+# Below this many taxonomy labels the cdist grid is already cheap; above it
+# the TF-IDF pre-pass takes over. 0.6 cosine is the acceptance cutoff —
+# anything weaker falls back to edit-distance scoring.
+_TFIDF_MIN_LABELS = 2000
+_TFIDF_MIN_COSINE = 0.6
+
+def _normalize_label(text: str) -> str:
+    """Lowercases, strips punctuation, and drops stopwords for token matching."""
+    tokens = _PUNCT_RE.sub(" ", text.lower()).split()
+    kept = [t for t in tokens if t not in _STOPWORDS]
+    # A label made entirely of stopwords (e.g. 'Total') keeps its tokens.
+    return " ".join(kept or tokens)
+
 # --- Taxonomy Parser Class ---
 class SSMxT2022TaxonomyParser:
     """
@@ -30,12 +98,64 @@ class SSMxT2022TaxonomyParser:
     def __init__(self, taxonomy_dir: Path):
         self.taxonomy_dir = taxonomy_dir
         self.concepts = {} # {concept_name: {label_en, label_local, ...}}
+        # PATCH: Flat lowercased lookup structures built once after parsing
+        # (2026-08-29); see _build_indexes. The nested self.concepts dict stays
+        # around for diagnostics only — the hot path reads the aligned arrays.
+        self._lower_index: Dict[str, str] = {} # normalized label -> concept name
+        self.labels_array: List[str] = []   # normalized label texts (SoA, ...
+        self.concepts_array: List[str] = [] # ... aligned with concept names)
         self.load_concepts()
 
+    def _build_indexes(self):
+        """
+        Builds flat lowercased lookup structures from self.concepts.
+        _lower_index gives O(1) exact matching on a normalized label;
+        labels_array/concepts_array are two aligned flat lists (structure of
+        arrays) consumed by fuzzy matching — contiguous, cache-friendly, and
+        passable straight into rapidfuzz, so per-query code never traverses
+        the nested concept dicts.
+        """
+        self._lower_index.clear()
+        del self.labels_array[:]
+        del self.concepts_array[:]
+        # label_en duplicates an entry of the labels dict (and roles can
+        # repeat the same text), so dedupe (concept, normalized label) pairs —
+        # every extra entry is a wasted cdist column and TF-IDF corpus row.
+        seen_pairs = set()
+        for concept_name, concept_info in self.concepts.items():
+            label_en = concept_info.get('label_en')
+            label_texts = [label_en] if label_en else []
+            label_texts.extend(concept_info.get('labels', {}).values())
+            for label_text in label_texts:
+                if not label_text:
+                    continue
+                # Exact matching keys on the plain lowered label; fuzzy choices
+                # go through the shared token normalization.
+                self._lower_index.setdefault(label_text.strip().lower(), concept_name)
+                normalized = _normalize_label(label_text)
+                if (concept_name, normalized) in seen_pairs:
+                    continue
+                seen_pairs.add((concept_name, normalized))
+                self.labels_array.append(normalized)
+                self.concepts_array.append(concept_name)
+
+    def _add_label(self, concept_name: str, lang: str, role: str, label_text: str) -> None:
+        """Records one label resource under its concept in self.concepts."""
+        entry = self.concepts.setdefault(concept_name, {'labels': {}})
+        entry['labels'][f'label_{lang}_{role}'] = label_text
+        # Also store a simpler 'label_en' if available
+        if lang == 'en' and 'label_en' not in entry:
+            entry['label_en'] = label_text
+        if lang != 'en' and 'label_local' not in entry:
+            entry['label_local'] = label_text # Store first non-en label found
+
     def load_concepts(self):
         """
         Loads concept names and labels from the taxonomy files.
-        Specifically looks for the 'label.xml' file.
+        Specifically looks for the 'label.xml' file and streams it in a single
+        iterparse pass (lxml's C parser when installed, stdlib ElementTree
+        otherwise), clearing each element after processing so memory stays
+        flat even on large XBRL linkbases.
         """
         label_xml_path = None
         for root, dirs, files in os.walk(self.taxonomy_dir):
@@ -50,78 +170,113 @@ class SSMxT2022TaxonomyParser:
             logger.error(f"Label XML file not found in {self.taxonomy_dir}")
             return
 
+        # PATCH: Pickle cache of the parsed concepts (2026-08-29). The linkbase
+        # is immutable between taxonomy releases, so repeat runs load the dict
+        # in milliseconds instead of re-parsing XML. Keyed by mtime + size.
+        st = label_xml_path.stat()
+        cache_key = (st.st_mtime_ns, st.st_size)
+        cache_path = label_xml_path.parent / (label_xml_path.stem + ".concepts.pkl")
+        cached_concepts = self._load_taxonomy_cache(cache_path, cache_key)
+        if cached_concepts is not None:
+            self.concepts = cached_concepts
+            self._build_indexes()
+            logger.info(f"Loaded {len(self.concepts)} concepts from cache {cache_path.name}")
+            return
+
         logger.info(f"Loading labels from {label_xml_path}")
+        # Single streaming pass: match elements by local name so no up-front
+        # namespace-sniffing parse is needed. xlink is the one fixed namespace
+        # we must read attributes from. The shipped linkbases use opaque arc
+        # handles (xlink:label="label_649"), so the concept name comes from
+        # joining <link:label> -> <link:labelArc> -> <link:loc xlink:href>.
+        xlink_ns = 'http://www.w3.org/1999/xlink'
+        xml_ns = 'http://www.w3.org/XML/1998/namespace'
+        loc_concepts: Dict[str, str] = {} # loc handle -> concept name (from xlink:href)
+        arc_sources: Dict[str, str] = {} # label-resource handle -> loc handle
+        pending_labels: List[Tuple[str, str, str, str]] = [] # (handle, lang, role, text)
+        parse_ok = False
         try:
-            tree = ET.parse(label_xml_path)
-            root = tree.getroot()
-            # Define namespaces if present in the XML
-            # Example namespace might be like: xmlns:link="http://www.xbrl.org/2003/linkbase"
-            # You might need to adjust based on the actual XML structure
-            # For now, assuming no namespace or using local tags
-            # If namespaces are present, you'd use them like:
-            # label_role = root.find(".//{http://www.xbrl.org/2003/linkbase}roleType[@roleURI='http://www.xbrl.org/2008/role/label']")
-            # A more robust way is to get the default namespace dynamically:
-            # ns = {'link': 'http://www.xbrl.org/2003/linkbase', 'xlink': 'http://www.w3.org/1999/xlink'}
-            # Or find the namespace map from the root element:
-            # _, tags = root.tag.split('}') if '}' in root.tag else ('', root.tag)
-            # For simplicity, assuming no prefixes are needed in the find expression if namespace is default.
-            # The actual structure might require namespace handling.
-            # Let's attempt to find label resources directly.
-            # Common structure is: <link:label> with attributes like for (concept), lang, role, and text content.
-            # Example tag might be {http://www.xbrl.org/2003/linkbase}label
-            # Let's get the namespace map from the root:
-            namespace_map = {}
-            for event, elem in ET.iterparse(str(label_xml_path), events=('start-ns',)):
-                 if event == 'start-ns':
-                     prefix, uri = elem
-                     namespace_map[prefix if prefix else 'default'] = uri
-            logger.debug(f"Detected namespaces: {namespace_map}")
-            # Assuming the default namespace for linkbase elements is common
-            # Typical URIs: http://www.xbrl.org/2003/XLink-1.1, http://www.xbrl.org/2003/linkbase
-            # Let's assume the default namespace for linkbase elements if present
-            # Find the default namespace for linkbase elements
-            default_ns = namespace_map.get('default', namespace_map.get('link', ''))
-            if default_ns:
-                 # Use the default namespace for finding elements
-                 # The xlink namespace is often needed for 'href' attribute
-                 xlink_ns = namespace_map.get('xlink', 'http://www.w3.org/1999/xlink')
-                 # Example: find elements like <link:labelArc>
-                 # labels = root.findall(f".//{{{default_ns}}}label")
-                 # Resources are often under <link:labelLink>
-                 label_links = root.findall(f".//{{{default_ns}}}labelLink")
-                 for link in label_links:
-                     label_resources = link.findall(f".//{{{default_ns}}}label")
-                     for label_elem in label_resources:
-                         concept_href = label_elem.get(f"{{{xlink_ns}}}resource") # xlink:href points to the concept
-                         if concept_href:
-                             # Extract the concept name from the href (e.g., #ca-mfrs_Revenue)
-                             concept_name = concept_href.split('#')[-1]
-                             lang = label_elem.get('lang', 'en')
-                             role = label_elem.get('role', '')
-                             label_text = label_elem.text.strip() if label_elem.text else ''
-                             if concept_name not in self.concepts:
-                                 self.concepts[concept_name] = {'labels': {}}
-                             self.concepts[concept_name]['labels'][f'label_{lang}_{role}'] = label_text
-                             # Also store a simpler 'label_en' if available
-                             if lang == 'en' and 'label_en' not in self.concepts[concept_name]:
-                                 self.concepts[concept_name]['label_en'] = label_text
-                             if lang != 'en' and 'label_local' not in self.concepts_name]:
-                                 self.concepts[concept_name]['label_local'] = label_text # Store first non-en label found
-
-            # If no default namespace found, try without namespace
+            if lxml_etree is not None:
+                context = lxml_etree.iterparse(str(label_xml_path), events=('end',))
             else:
-                 labels = root.findall(".//label") # This is less likely to work if namespace is required
-                 # This path assumes no namespace is used, which is rare for XBRL
-                 # The previous block with namespace handling is more robust.
-                 # If the previous block didn't find labels, this might be needed, but structure likely requires namespace.
-                 # Let's assume the previous block handled it correctly for now.
-                 pass
-
+                context = ET.iterparse(str(label_xml_path), events=('end',))
+            for event, elem in context:
+                tag = elem.tag
+                local_name = tag.rsplit('}', 1)[-1] if isinstance(tag, str) else ''
+                if local_name == 'label':
+                    lang = elem.get('lang') or elem.get(f"{{{xml_ns}}}lang") or 'en'
+                    role = elem.get('role') or elem.get(f"{{{xlink_ns}}}role") or ''
+                    label_text = elem.text.strip() if elem.text else ''
+                    concept_href = elem.get(f"{{{xlink_ns}}}resource")
+                    if concept_href:
+                        # Resource names the concept directly (e.g. #ca-mfrs_Revenue)
+                        self._add_label(concept_href.split('#')[-1], lang, role, label_text)
+                    else:
+                        handle = elem.get(f"{{{xlink_ns}}}label")
+                        if handle:
+                            pending_labels.append((handle, lang, role, label_text))
+                elif local_name == 'loc':
+                    handle = elem.get(f"{{{xlink_ns}}}label")
+                    href = elem.get(f"{{{xlink_ns}}}href")
+                    if handle and href:
+                        loc_concepts[handle] = href.split('#')[-1]
+                elif local_name == 'labelArc':
+                    arc_from = elem.get(f"{{{xlink_ns}}}from")
+                    arc_to = elem.get(f"{{{xlink_ns}}}to")
+                    if arc_from and arc_to:
+                        arc_sources[arc_to] = arc_from
+                # Release the processed subtree so the parse stays O(1) in memory.
+                elem.clear()
+                if lxml_etree is not None and elem.getparent() is not None:
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
+            parse_ok = True
         except ET.ParseError as e:
             logger.error(f"Error parsing label XML {label_xml_path}: {e}")
         except Exception as e:
             logger.error(f"Error loading concepts from {label_xml_path}: {e}")
 
+        # Join handle-addressed label resources back to their concepts:
+        # label handle -> arc -> loc handle -> concept href. Labels whose
+        # chain is broken are dropped rather than misfiled under the handle.
+        for handle, lang, role, label_text in pending_labels:
+            concept_name = loc_concepts.get(arc_sources.get(handle, handle))
+            if concept_name:
+                self._add_label(concept_name, lang, role, label_text)
+            else:
+                logger.debug(f"No loc/arc chain for label resource '{handle}'; skipped.")
+
+        # Only cache a clean parse: a pickled partial/empty concepts dict
+        # would be replayed on every run until the linkbase itself changes.
+        if parse_ok:
+            self._store_taxonomy_cache(cache_path, cache_key)
+        self._build_indexes()
+        logger.info(f"Indexed {len(self.labels_array)} labels across {len(self.concepts)} concepts.")
+
+    @staticmethod
+    def _load_taxonomy_cache(cache_path: Path, cache_key: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+        """Returns cached concepts if the cache matches the source file, else None."""
+        if not cache_path.exists():
+            return None
+        try:
+            with open(cache_path, 'rb') as f:
+                payload = pickle.load(f)
+            if payload.get('key') == cache_key:
+                return payload['concepts']
+            logger.info(f"Taxonomy cache {cache_path.name} is stale; re-parsing.")
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable taxonomy cache {cache_path}: {e}")
+        return None
+
+    def _store_taxonomy_cache(self, cache_path: Path, cache_key: Tuple[int, int]) -> None:
+        """Best-effort dump of the parsed concepts for subsequent runs."""
+        try:
+            with open(cache_path, 'wb') as f:
+                pickle.dump({'key': cache_key, 'concepts': self.concepts}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.warning(f"Failed to write taxonomy cache {cache_path}: {e}")
+
     def get_concept_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """Retrieve concept details by its name."""
         return self.concepts.get(name)
@@ -139,111 +294,309 @@ class MappingAgent:
         self.taxonomy_parser = taxonomy_parser
         self.reference_xlsx_path = reference_xlsx_path
         self.reference_mappings = self._load_reference_mappings()
+        # PATCH: Aligned label/concept arrays come pre-normalized from the
+        # parser (2026-08-29); fuzzy matching scores against self._choices
+        # directly, with no per-row dict traversal, .lower(), or tuple
+        # unpacking — the SoA lists are shared, not copied.
+        self._pair_concepts: List[str] = taxonomy_parser.concepts_array
+        self._choices: List[str] = taxonomy_parser.labels_array
+        # PATCH: Char-trigram TF-IDF matrix over the label corpus (2026-08-29).
+        # Only built for large taxonomies, where the sparse cosine multiply in
+        # _tfidf_match_batch beats scoring the full edit-distance grid.
+        self._tfidf_vec = None
+        self._tfidf_matrix = None
+        if TfidfVectorizer is not None and len(self._choices) >= _TFIDF_MIN_LABELS:
+            self._tfidf_vec = TfidfVectorizer(analyzer='char_wb', ngram_range=(3, 3))
+            self._tfidf_matrix = self._tfidf_vec.fit_transform(self._choices).T.tocsr()
+            logger.info(f"TF-IDF matcher enabled over {len(self._choices)} labels.")
+        # Exact-match index: start from the taxonomy's normalized labels, then
+        # let reference-workbook mappings take precedence.
+        self._exact_index: Dict[str, str] = dict(taxonomy_parser._lower_index)
+        for label, element_name in self.reference_mappings.items():
+            self._exact_index[label.strip().lower()] = element_name
+        # PATCH: Memoized fuzzy results (2026-08-29). Filings repeat the same
+        # line-item labels across statements and years; the taxonomy is
+        # immutable per agent instance, so scores never need recomputing.
+        # Keyed by (normalized label, threshold).
+        self._match_cache: Dict[Tuple[str, int], Tuple[Optional[str], float]] = {}
 
     def _load_reference_mappings(self) -> Dict[str, str]:
         """
         Loads a reference mapping dictionary from the Excel file (if available).
         This can be used for high-confidence lookups or validation during development.
         Assumes the Excel file has columns like 'Label' and 'Element Name'.
+        Streams cells with read-only openpyxl (no DataFrame materialization;
+        pandas remains as a fallback reader) and caches the resulting dict to
+        a pickle keyed by the workbook's mtime + size, so later runs skip
+        Excel parsing entirely.
         """
         if not self.reference_xlsx_path or not self.reference_xlsx_path.exists():
             logger.warning(f"Reference Excel file not found: {self.reference_xlsx_path}")
             return {}
 
+        # PATCH: Pickle cache with an mtime+size guard (2026-08-29)
+        st = self.reference_xlsx_path.stat()
+        cache_key = (st.st_mtime_ns, st.st_size)
+        cache_path = self.reference_xlsx_path.with_suffix('.mappings.pkl')
+        try:
+            if cache_path.exists():
+                with open(cache_path, 'rb') as f:
+                    payload = pickle.load(f)
+                if payload.get('key') == cache_key:
+                    logger.info(f"Loaded {len(payload['mappings'])} reference mappings from cache.")
+                    return payload['mappings']
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable reference-mapping cache {cache_path}: {e}")
+
         logger.info(f"Loading reference mappings from {self.reference_xlsx_path}")
         try:
-            # Load the Excel file
-            df = pd.read_excel(self.reference_xlsx_path, sheet_name=0) # Assuming first sheet
-
-            # Identify relevant columns - this requires knowledge of the Excel structure
-            # Common names might be 'Label', 'Element Name', 'Concept Name', 'Disclosure', 'Amount'
-            # Attempt to find standard names, or prompt user if ambiguous
-            label_col = None
-            element_col = None
-            for col in df.columns:
-                if 'label' in col.lower():
-                    label_col = col
-                elif 'element' in col.lower() or 'concept' in col.lower():
-                    element_col = col
-            if not label_col or not element_col:
-                 logger.warning(f"Could not find standard 'Label' and 'Element Name' columns in {self.reference_xlsx_path}. Columns found: {list(df.columns)}")
-                 return {}
-
-            # Create a mapping dictionary: {label: element_name}
-            # Drop rows where either label or element is NaN
-            df_clean = df[[label_col, element_col]].dropna()
-            mapping_dict = dict(zip(df_clean[label_col].astype(str), df_clean[element_col].astype(str)))
+            try:
+                import openpyxl
+            except ImportError:
+                openpyxl = None
+            if openpyxl is not None:
+                mapping_dict = self._read_mappings_openpyxl(self.reference_xlsx_path)
+            elif pd is not None:
+                mapping_dict = self._read_mappings_pandas(self.reference_xlsx_path)
+            else:
+                logger.warning("Neither openpyxl nor pandas available; cannot read reference workbook.")
+                return {}
             logger.info(f"Loaded {len(mapping_dict)} reference mappings.")
+            try:
+                with open(cache_path, 'wb') as f:
+                    pickle.dump({'key': cache_key, 'mappings': mapping_dict}, f,
+                                protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception as e:
+                logger.warning(f"Failed to write reference-mapping cache {cache_path}: {e}")
             return mapping_dict
         except Exception as e:
             logger.error(f"Error loading reference mappings from {self.reference_xlsx_path}: {e}")
             return {}
 
+    @staticmethod
+    def _find_mapping_columns(column_names: List[Any]) -> Tuple[Optional[int], Optional[int]]:
+        """Locates the label and element/concept columns in a header row."""
+        label_col = None
+        element_col = None
+        for idx, col in enumerate(column_names):
+            name = str(col).lower() if col is not None else ''
+            if 'label' in name:
+                label_col = idx
+            elif 'element' in name or 'concept' in name:
+                element_col = idx
+        return label_col, element_col
+
+    def _read_mappings_openpyxl(self, xlsx_path: Path) -> Dict[str, str]:
+        """Streams {label: element_name} pairs via read-only openpyxl."""
+        import openpyxl
+        wb = openpyxl.load_workbook(xlsx_path, read_only=True, data_only=True)
+        try:
+            ws = wb.worksheets[0] # Assuming first sheet
+            rows = ws.iter_rows(values_only=True)
+            header = next(rows, None)
+            if not header:
+                return {}
+            label_col, element_col = self._find_mapping_columns(list(header))
+            if label_col is None or element_col is None:
+                logger.warning(f"Could not find standard 'Label' and 'Element Name' columns in {xlsx_path}. Columns found: {list(header)}")
+                return {}
+            mapping_dict = {}
+            for row in rows:
+                if len(row) <= max(label_col, element_col):
+                    continue
+                label, element = row[label_col], row[element_col]
+                if label is not None and element is not None:
+                    mapping_dict[str(label)] = str(element)
+            return mapping_dict
+        finally:
+            wb.close()
+
+    def _read_mappings_pandas(self, xlsx_path: Path) -> Dict[str, str]:
+        """Fallback reader: full-DataFrame load via pandas."""
+        df = pd.read_excel(xlsx_path, sheet_name=0) # Assuming first sheet
+        label_idx, element_idx = self._find_mapping_columns(list(df.columns))
+        if label_idx is None or element_idx is None:
+            logger.warning(f"Could not find standard 'Label' and 'Element Name' columns in {xlsx_path}. Columns found: {list(df.columns)}")
+            return {}
+        label_col, element_col = df.columns[label_idx], df.columns[element_idx]
+        # Drop rows where either label or element is NaN
+        df_clean = df[[label_col, element_col]].dropna()
+        return dict(zip(df_clean[label_col].astype(str), df_clean[element_col].astype(str)))
+
     def _fuzzy_match_label(self, extracted_label: str, threshold: int = 80) -> Optional[Tuple[str, float]]:
         """
         Attempts to find a matching taxonomy concept using fuzzy string matching.
         Returns the best match concept name and its confidence score (0-100).
         """
-        best_match = None
-        best_score = 0
-        best_concept_name = None
-
-        for concept_name, concept_info in self.taxonomy_parser.get_all_concepts().items():
-            labels = concept_info.get('labels', {})
-            # Check against all available labels for the concept
-            for label_key, label_text in labels.items():
-                if label_text: # Ensure label text is not empty
-                    score = fuzz.partial_ratio(extracted_label.lower(), label_text.lower())
-                    if score > best_score:
-                        best_score = score
-                        best_concept_name = concept_name
-                        best_match = label_text
-            # Also check against the simplified 'label_en' if present
-            label_en = concept_info.get('label_en')
-            if label_en:
-                score = fuzz.partial_ratio(extracted_label.lower(), label_en.lower())
+        query = _normalize_label(extracted_label)
+        cache_key = (query, threshold)
+        cached = self._match_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Fast path: rapidfuzz scores the whole pre-normalized choice list in
+        # one C++ call (processor=None since both sides are already
+        # normalized). token_set_ratio compares deduplicated token sets, which
+        # is both faster on the short normalized strings and less prone to the
+        # spurious high scores partial_ratio gave on short labels.
+        if rf_process is not None and self._choices:
+            best = rf_process.extractOne(
+                query, self._choices, scorer=fuzz.token_set_ratio,
+                score_cutoff=threshold, processor=None,
+            )
+            if best is not None:
+                _, score, idx = best
+                result = (self._pair_concepts[idx], score / 100.0) # Normalize score to 0-1
+            else:
+                result = (None, 0.0)
+        else:
+            # Fallback: plain Python loop over the flattened pairs (thefuzz).
+            # PATCH: Raise the running cutoff and stop at a perfect score (2026-08-29)
+            # Feeding the current best back as score_cutoff lets the scorer
+            # abandon candidates early once they cannot beat it, and a score
+            # of 100 ends the scan outright.
+            best_score = 0
+            best_concept_name = None
+            for concept_name, label_text in zip(self._pair_concepts, self._choices):
+                try:
+                    score = fuzz.token_set_ratio(query, label_text, score_cutoff=best_score)
+                except TypeError: # thefuzz scorers take no score_cutoff
+                    score = fuzz.token_set_ratio(query, label_text)
                 if score > best_score:
                     best_score = score
                     best_concept_name = concept_name
-                    best_match = label_en
+                    if best_score == 100:
+                        break
+            if best_score >= threshold:
+                result = (best_concept_name, best_score / 100.0) # Normalize score to 0-1
+            else:
+                result = (None, 0.0)
 
-        if best_score >= threshold:
-            return best_concept_name, best_score / 100.0 # Normalize score to 0-1
-        else:
-            return None, 0.0
+        self._match_cache[cache_key] = result
+        return result
 
     def _exact_match_label(self, extracted_label: str) -> Optional[str]:
         """
-        Attempts to find an exact match for the label in the reference mappings.
+        Attempts to find an exact match for the label (O(1) lookup in the
+        precomputed index; reference-workbook mappings take precedence over
+        taxonomy labels).
         """
-        # Check reference mappings first for high confidence
-        if self.reference_mappings:
-            for label, element_name in self.reference_mappings.items():
-                if extracted_label.lower().strip() == label.lower().strip():
-                    return element_name
-        # If not found in reference, could also check taxonomy labels directly for exact match
-        # This is less common but possible
-        for concept_name, concept_info in self.taxonomy_parser.get_all_concepts().items():
-            labels = concept_info.get('labels', {}).values()
-            label_en = concept_info.get('label_en')
-            if label_en and extracted_label.lower().strip() == label_en.lower().strip():
-                return concept_name
-            for label_text in labels:
-                 if label_text and extracted_label.lower().strip() == label_text.lower().strip():
-                     return concept_name
-        return None
+        return self._exact_index.get(extracted_label.lower().strip())
+
+    def _tfidf_match_batch(self, queries: List[str]) -> List[Optional[Tuple[str, float]]]:
+        """
+        Scores normalized queries against the whole label corpus in one sparse
+        matrix multiply (rows are l2-normalized, so the dot product is cosine
+        similarity). Returns one (concept, cosine) tuple per query, or None
+        where the best cosine falls below _TFIDF_MIN_COSINE — those entries
+        fall back to edit-distance scoring in the caller.
+        """
+        sims = self._tfidf_vec.transform(queries).dot(self._tfidf_matrix).tocsr()
+        results: List[Optional[Tuple[str, float]]] = []
+        for i in range(sims.shape[0]):
+            start, end = sims.indptr[i], sims.indptr[i + 1]
+            if start == end:
+                results.append(None)
+                continue
+            k = sims.data[start:end].argmax()
+            score = float(sims.data[start + k])
+            if score < _TFIDF_MIN_COSINE:
+                results.append(None)
+            else:
+                results.append((self._pair_concepts[int(sims.indices[start + k])], score))
+        return results
+
+    def _fuzzy_match_batch(self, queries: List[str], threshold: int = 80) -> List[Tuple[Optional[str], float]]:
+        """
+        Scores many extracted labels against the whole taxonomy at once.
+        With rapidfuzz + numpy available this is a single cdist call — one
+        C-side score matrix (uint8, threaded) instead of re-entering the
+        scorer per query. Returns one (concept_name or None, confidence)
+        tuple per query, aligned with the input.
+        """
+        # Normalize each query exactly once; the normalized form serves as both
+        # the cache key and the scoring input (choices are pre-normalized at
+        # taxonomy load, so no per-pair normalization happens anywhere).
+        lowered = [_normalize_label(q) for q in queries]
+
+        # Serve memoized labels first; only score what the cache has not seen.
+        results: List[Optional[Tuple[Optional[str], float]]] = [None] * len(queries)
+        miss_positions: List[int] = []
+        miss_queries: List[str] = []
+        for i, q in enumerate(lowered):
+            cached = self._match_cache.get((q, threshold))
+            if cached is not None:
+                results[i] = cached
+            else:
+                miss_positions.append(i)
+                miss_queries.append(q)
+
+        if miss_queries:
+            scored: List[Optional[Tuple[Optional[str], float]]] = [None] * len(miss_queries)
+            # Large-taxonomy pre-pass: sparse cosine resolves most queries in
+            # one GEMM; only the weak matches reach the edit-distance scorers.
+            if self._tfidf_matrix is not None:
+                scored = self._tfidf_match_batch(miss_queries)
+            rest = [j for j, r in enumerate(scored) if r is None]
+            if rest:
+                rest_queries = [miss_queries[j] for j in rest]
+                if rf_process is not None and np is not None and self._choices:
+                    scores = rf_process.cdist(
+                        rest_queries, self._choices,
+                        scorer=fuzz.token_set_ratio, processor=None,
+                        score_cutoff=threshold, dtype=np.uint8, workers=-1,
+                    )
+                    best_idx = scores.argmax(axis=1)
+                    best_score = scores[np.arange(len(rest_queries)), best_idx]
+                    rest_scored = [
+                        (self._pair_concepts[i], s / 100.0) if s >= threshold else (None, 0.0)
+                        for i, s in zip(best_idx.tolist(), best_score.tolist())
+                    ]
+                else:
+                    rest_scored = [self._fuzzy_match_label(q, threshold) for q in rest_queries]
+                for j, res in zip(rest, rest_scored):
+                    scored[j] = res
+            for pos, q, res in zip(miss_positions, miss_queries, scored):
+                self._match_cache[(q, threshold)] = res
+                results[pos] = res
+
+        return results
+
+    def _append_facts(self, mapped_facts: List[Dict[str, Any]], table: Dict[str, Any],
+                      table_idx: int, row_idx: int, row: List[Any], label_cell: str,
+                      matched_concept: str, confidence: float, method: str) -> None:
+        """Appends one fact per non-empty value column of a matched row."""
+        # Extract values from other columns (assuming columns are periods/amounts)
+        for col_idx, value in enumerate(row[1:], start=1): # Start from column 1
+            if value is not None and str(value).strip() != "":
+                fact = {
+                    "concept_name": matched_concept,
+                    "value": value,
+                    "source": {
+                        "table_name": table.get('name', f'Table_{table_idx}'),
+                        "row_index": row_idx,
+                        "column_index": col_idx,
+                        "label_text": str(label_cell)
+                    },
+                    "confidence": confidence,
+                    "mapping_method": method
+                }
+                mapped_facts.append(fact)
+                logger.debug(f"Mapped: '{label_cell}' -> '{matched_concept}' (Conf: {confidence:.2f}, Method: {method})")
 
     def map_tables(self, tables: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Maps a list of extracted tables to taxonomy concepts.
+        Two passes: exact matches resolve inline, then every row label that
+        missed is fuzzy-scored in one batched call (see _fuzzy_match_batch).
         Returns a list of mapped facts.
         """
         mapped_facts = []
+        pending = [] # rows awaiting fuzzy scoring: (table_idx, table, row_idx, row, label)
         for table_idx, table in enumerate(tables):
             logger.info(f"Processing table {table_idx}: {table.get('name', 'Unnamed Table')}")
             header_row_idx = table.get('header_row_index', 0)
             rows = table.get('data', [])
-            headers = rows[header_row_idx] if 0 <= header_row_idx < len(rows) else []
 
             # Assume the first column contains labels, subsequent columns contain values
             for row_idx, row in enumerate(rows):
@@ -254,35 +607,34 @@ class MappingAgent:
                 label_cell = row[0] if len(row) > 0 else ""
                 if not label_cell:
                     continue # Skip rows without a label
+                label = str(label_cell) # Convert once per row, not per use
 
                 # Attempt exact match first
-                matched_concept = self._exact_match_label(str(label_cell))
-                confidence = 1.0
-                method = "exact_ref" if matched_concept in self.reference_mappings.values() else "exact_tax"
-
-                if not matched_concept:
-                    # If no exact match, try fuzzy matching
-                    matched_concept, confidence = self._fuzzy_match_label(str(label_cell))
-                    method = "fuzzy"
-
+                matched_concept = self._exact_match_label(label)
                 if matched_concept:
-                    # Extract values from other columns (assuming columns are periods/amounts)
-                    for col_idx, value in enumerate(row[1:], start=1): # Start from column 1
-                        if value is not None and str(value).strip() != "":
-                            fact = {
-                                "concept_name": matched_concept,
-                                "value": value,
-                                "source": {
-                                    "table_name": table.get('name', f'Table_{table_idx}'),
-                                    "row_index": row_idx,
-                                    "column_index": col_idx,
-                                    "label_text": str(label_cell)
-                                },
-                                "confidence": confidence,
-                                "mapping_method": method
-                            }
-                            mapped_facts.append(fact)
-                            logger.debug(f"Mapped: '{label_cell}' -> '{matched_concept}' (Conf: {confidence:.2f}, Method: {method})")
+                    method = "exact_ref" if matched_concept in self.reference_mappings.values() else "exact_tax"
+                    self._append_facts(mapped_facts, table, table_idx, row_idx, row,
+                                       label, matched_concept, 1.0, method)
+                else:
+                    pending.append((table_idx, table, row_idx, row, label))
+
+        # Batch-score everything that missed the exact index.
+        # PATCH: Deduplicate before scoring (2026-08-29). Filings repeat the
+        # same line-item labels across years and statements; each distinct
+        # label is scored once and the result fanned back to every occurrence.
+        if pending:
+            seen: Dict[str, int] = {} # label -> position in unique_labels
+            unique_labels: List[str] = []
+            for p in pending:
+                if p[4] not in seen:
+                    seen[p[4]] = len(unique_labels)
+                    unique_labels.append(p[4])
+            unique_results = self._fuzzy_match_batch(unique_labels)
+            for table_idx, table, row_idx, row, label_cell in pending:
+                matched_concept, confidence = unique_results[seen[label_cell]]
+                if matched_concept:
+                    self._append_facts(mapped_facts, table, table_idx, row_idx, row,
+                                       label_cell, matched_concept, confidence, "fuzzy")
                 else:
                     logger.debug(f"No match found for label: '{label_cell}' (Conf: 0.0)")
 
@@ -310,6 +662,77 @@ class MappingAgent:
         logger.info(f"Mapping complete. Generated {len(mapped_facts)} mapped facts.")
         return mapped_facts
 
+# PATCH: Columnar Parquet persistence for mapped facts (2026-08-29)
+def save_mapped_facts(mapped_facts: List[Dict[str, Any]], output_path: Path,
+                      json_export: bool = False) -> Path:
+    """
+    Persists mapped facts for downstream analytics.
+
+    With pyarrow installed the facts are flattened into parallel columns and
+    written as Parquet: dictionary encoding collapses the heavily repeated
+    concept/table/method strings, so the file is typically an order of
+    magnitude smaller than the nested JSON and loads as a columnar table
+    without any per-fact parsing. The original JSON layout is still written
+    when json_export=True (or whenever pyarrow is unavailable).
+    Returns the path of the primary artifact written.
+    """
+    if pa is not None:
+        columns: Dict[str, list] = {
+            "concept_name": [], "value": [], "table_name": [], "row_index": [],
+            "column_index": [], "label_text": [], "confidence": [], "mapping_method": [],
+        }
+        for fact in mapped_facts:
+            source = fact["source"]
+            columns["concept_name"].append(fact["concept_name"])
+            columns["value"].append(str(fact["value"]))
+            columns["table_name"].append(source["table_name"])
+            columns["row_index"].append(source["row_index"])
+            columns["column_index"].append(source["column_index"])
+            columns["label_text"].append(source["label_text"])
+            columns["confidence"].append(fact["confidence"])
+            columns["mapping_method"].append(fact["mapping_method"])
+        parquet_path = output_path.with_suffix('.parquet')
+        pq.write_table(pa.table(columns), parquet_path)
+        logger.info(f"Mapped facts saved to {parquet_path}")
+        if not json_export:
+            return parquet_path
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(mapped_facts, f, indent=2, ensure_ascii=False)
+    logger.info(f"Mapped facts saved to {output_path}")
+    return output_path
+
+# PATCH: Parallel batch mapping across ingested files (2026-08-29). Each file
+# maps independently, so the __main__ block fans out across CPU cores. The
+# taxonomy is parsed once in the parent, pickled, and rebuilt per worker via
+# the pool initializer — workers never touch the linkbase XML.
+_WORKER_AGENT: Optional["MappingAgent"] = None
+
+def _init_mapping_worker(concepts_pickle: bytes, reference_xlsx_path: Optional[Path]) -> None:
+    """Pool initializer: rebuilds one MappingAgent in this worker process."""
+    global _WORKER_AGENT
+    parser = SSMxT2022TaxonomyParser.__new__(SSMxT2022TaxonomyParser)
+    parser.taxonomy_dir = TAXONOMY_DIR
+    parser.concepts = pickle.loads(concepts_pickle)
+    parser._lower_index = {}
+    parser.labels_array = []
+    parser.concepts_array = []
+    parser._build_indexes()
+    _WORKER_AGENT = MappingAgent(parser, reference_xlsx_path)
+
+def _map_one_file(json_path: Path) -> Tuple[str, int]:
+    """Worker: maps one ingestion output file and writes its facts."""
+    logger.info(f"Processing ingestion output file: {json_path.name}")
+    mapped_facts = _WORKER_AGENT.run(json_path)
+    output_path = OUTPUT_DIR / f"mapped_{json_path.name}" # e.g., mapped_example.json
+    try:
+        # Parquet when pyarrow is installed; set MAPPING_JSON_EXPORT=1 to
+        # additionally keep the legacy JSON output alongside it.
+        save_mapped_facts(mapped_facts, output_path,
+                          json_export=os.environ.get("MAPPING_JSON_EXPORT") == "1")
+    except Exception as e:
+        logger.error(f"Failed to save mapped facts to {output_path}: {e}")
+    return json_path.name, len(mapped_facts)
+
 # --- Main Execution Block ---
 if __name__ == "__main__":
     # --- Setup ---
@@ -318,22 +741,21 @@ if __name__ == "__main__":
     if not taxonomy_parser.concepts:
         logger.error("Failed to load taxonomy concepts. Cannot proceed with mapping.")
         exit(1)
-    mapping_agent = MappingAgent(taxonomy_parser, REFERENCE_XLSX_PATH)
 
     # --- Process Ingested Files ---
-    for json_file in INGESTED_DATA_DIR.glob("*.json"):
-        logger.info(f"Processing ingestion output file: {json_file.name}")
-        mapped_facts = mapping_agent.run(json_file)
-
-        # --- Output Mapped Facts ---
-        output_filename = f"mapped_{json_file.name}" # e.g., mapped_example.json
-        output_path = OUTPUT_DIR / output_filename
-        os.makedirs(OUTPUT_DIR, exist_ok=True) # Ensure output directory exists
-        try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(mapped_facts, f, indent=2, ensure_ascii=False)
-            logger.info(f"Mapped facts saved to {output_path}")
-        except Exception as e:
-            logger.error(f"Failed to save mapped facts to {output_path}: {e}")
+    json_files = sorted(INGESTED_DATA_DIR.glob("*.json"))
+    os.makedirs(OUTPUT_DIR, exist_ok=True) # Ensure output directory exists
+    if len(json_files) > 1:
+        concepts_pickle = pickle.dumps(taxonomy_parser.concepts, protocol=pickle.HIGHEST_PROTOCOL)
+        with ProcessPoolExecutor(initializer=_init_mapping_worker,
+                                 initargs=(concepts_pickle, REFERENCE_XLSX_PATH)) as executor:
+            for name, fact_count in executor.map(_map_one_file, json_files):
+                logger.info(f"{name}: {fact_count} mapped facts written.")
+    else:
+        # Zero or one file: pool startup costs more than it saves.
+        _WORKER_AGENT = MappingAgent(taxonomy_parser, REFERENCE_XLSX_PATH)
+        for json_file in json_files:
+            name, fact_count = _map_one_file(json_file)
+            logger.info(f"{name}: {fact_count} mapped facts written.")
 
     logger.info("Mapping Agent execution completed.")